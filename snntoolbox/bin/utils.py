@@ -457,6 +457,9 @@ def update_setup(config_filepath):
         log_vars_all.remove('all')
         config.set('output', 'log_vars', str(log_vars_all))
 
+    assert config.getint('output', 'verbose_stride') >= 1, \
+        "Parameter 'verbose_stride' must be a positive integer."
+
     # Change matplotlib plot properties, e.g. label font size
     try:
         import matplotlib
@@ -30,9 +30,14 @@ class ModelParser(AbstractModelParser):
                                 'binary_tanh_unit': 'binary_tanh',
                                 'binary_sigmoid_unit': 'binary_sigmoid',
                                 'linear': 'linear'}
+        self._layers = None
+        self._layer_idxs = None
 
     def get_layer_iterable(self):
-        return lasagne.layers.get_all_layers(self.input_model)
+        if self._layers is None:
+            self._layers = lasagne.layers.get_all_layers(self.input_model)
+            self._layer_idxs = {id(l): i for i, l in enumerate(self._layers)}
+        return self._layers
 
     def get_type(self, layer):
         class_name = layer.__class__.__name__
@@ -119,9 +124,8 @@ class ModelParser(AbstractModelParser):
 
     def get_outbound_layers(self, layer):
         layers = self.get_layer_iterable()
-        layer_ids = [id(l) for l in layers]
-        current_idx = layer_ids.index(id(layer))
-        return [] if current_idx + 1 >= len(layer_ids) \
+        current_idx = self._layer_idxs[id(layer)]
+        return [] if current_idx + 1 >= len(layers) \
             else [layers[current_idx + 1]]
 
     def parse_concatenate(self, layer, attributes):
@@ -204,24 +208,21 @@ def evaluate(val_fn, batch_size, num_to_test, x_test=None, y_test=None,
     dataflow: keras.ImageDataGenerator.flow_from_directory
     """
 
-    err = 0
-    loss = 0
     batches = int(len(x_test) / batch_size) if x_test is not None else \
         int(num_to_test / batch_size)
 
+    losses = np.empty(batches)
+    errs = np.empty(batches)
     for i in range(batches):
         if x_test is not None:
             x_batch = x_test[i*batch_size: (i+1)*batch_size]
             y_batch = y_test[i*batch_size: (i+1)*batch_size]
         else:
             x_batch, y_batch = dataflow.next()
-        new_loss, new_err = val_fn(x_batch, y_batch)
-        err += new_err
-        loss += new_loss
+        losses[i], errs[i] = val_fn(x_batch, y_batch)
 
-    err /= batches
-    loss /= batches
-    acc = 1 - err  # Convert error into accuracy here.
+    loss = np.mean(losses)
+    acc = 1 - np.mean(errs)  # Convert error into accuracy here.
 
     print("Test loss: {:.2f}".format(loss))
     print("Test accuracy: {:.2%}\n".format(acc))
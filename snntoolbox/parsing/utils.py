@@ -143,7 +143,7 @@ class AbstractModelParser:
                      'inbound': self.get_inbound_names(layer, name_map)})
                 name_map['AveragePooling2D' + str(idx)] = idx
                 idx += 1
-                num_str = str(idx) if idx > 9 else '0' + str(idx)
+                num_str = '{:02d}'.format(idx)
                 shape_string = str(np.prod(layer.output_shape[1:]))
                 self._layer_list.append(
                     {'name': num_str + 'Flatten_' + shape_string,
@@ -436,7 +436,7 @@ class AbstractModelParser:
                                               output_shape[2],
                                               output_shape[3])
 
-        num_str = str(idx) if idx > 9 else '0' + str(idx)
+        num_str = '{:02d}'.format(idx)
 
         return num_str + layer_type + shape_string
 
@@ -467,7 +467,7 @@ class AbstractModelParser:
                 self.get_type(layer) != 'Flatten':
             assert len(previous_layers) == 1, "Layer to flatten must be unique."
             print("Inserting layer Flatten.")
-            num_str = str(idx) if idx > 9 else '0' + str(idx)
+            num_str = '{:02d}'.format(idx)
             shape_string = str(np.prod(prev_layer_output_shape[1:]))
             self._layer_list.append({
                 'name': num_str + 'Flatten_' + shape_string,
@@ -796,13 +796,7 @@ def save_parameters(params, filepath, fileformat='h5'):
         import h5py
         with h5py.File(filepath, mode='w') as f:
             for i, p in enumerate(params):
-                if i < 10:
-                    j = '00' + str(i)
-                elif i < 100:
-                    j = '0' + str(i)
-                else:
-                    j = str(i)
-                f.create_dataset('param_'+j, data=p)
+                f.create_dataset('param_{:03d}'.format(i), data=p)
 
 
 def has_weights(layer):
@@ -23,6 +23,12 @@ from keras.layers import Dense, Flatten, AveragePooling2D, MaxPooling2D, Conv2D
 from keras.layers import Layer, Concatenate
 from keras.activations import softmax, relu
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 standard_library.install_aliases()
 
 
@@ -242,27 +248,85 @@ def to_binary_numpy(x, num_bits):
         distributed across the first dimension of ``binary_array``.
     """
 
-    binary_array = np.zeros([num_bits] + list(x.shape[1:]))
+    if num_bits > 64:
+        # Fixed-point integers do not fit into uint64; decompose elementwise.
+        x_flat = np.ravel(x[0]).astype(np.float64)
+        powers = np.array([2**-i for i in range(num_bits)], np.float64)
+        binary_array = np.zeros((num_bits, x_flat.size), np.float32)
+        _to_binary_elementwise(x_flat, powers, binary_array)
+        return np.reshape(binary_array, [num_bits] + list(x.shape[1:]))
+
+    # The greedy subtraction of powers 2**-i is a binary decomposition of the
+    # fixed-point integer ``floor(x * 2**(num_bits - 1))``. Values >= 2 exceed
+    # the representable range and saturate to all ones. The saturation is
+    # applied in the integer domain, because ``2**num_bits - 1`` is not exact
+    # in floating point for large ``num_bits``.
+    # Negative and NaN values map to all zeros.
+    saturated = x[0] >= 2
+    scaled = np.floor(np.where((x[0] > 0) & ~saturated, x[0], 0) *
+                      2 ** (num_bits - 1)).astype(np.uint64)
+    scaled[saturated] = np.uint64(2 ** num_bits - 1)
+
+    if num_bits <= 16:
+        # Small integer domain: Look up the bit patterns in a table.
+        return get_bit_lut(num_bits)[:, scaled]
+
+    shifts = np.arange(num_bits - 1, -1, -1, dtype=np.uint64)
+    shifts = np.reshape(shifts, [num_bits] + [1] * (x.ndim - 1))
+    binary_array = ((scaled[None, Ellipsis] >> shifts) & np.uint64(1)).astype(
+        np.float32)
+    return binary_array
 
-    powers = [2**-i for i in range(num_bits)]
 
-    if len(x.shape) > 2:
-        for l in range(x.shape[1]):
-            for m in range(x.shape[2]):
-                for n in range(x.shape[3]):
-                    f = x[0, l, m, n]
-                    for i in range(num_bits):
-                        if f >= powers[i]:
-                            binary_array[i, l, m, n] = 1
-                            f -= powers[i]
-    else:
-        for l in range(x.shape[1]):
-            f = x[0, l]
-            for i in range(num_bits):
-                if f >= powers[i]:
-                    binary_array[i, l] = 1
-                    f -= powers[i]
-    return binary_array
+_bit_luts = {}
+
+
+def get_bit_lut(num_bits):
+    """Get a lookup table of the binary representation of integers.
+
+    The table is computed on the first call for a given ``num_bits`` and
+    cached.
+
+    Parameters
+    ----------
+
+    num_bits: int
+        Number of bits. Must not exceed 16.
+
+    Returns
+    -------
+
+    bit_lut: ndarray
+        Array of shape (``num_bits``, ``2**num_bits``). Column ``i`` contains
+        the bits of the integer ``i``, most significant bit first.
+    """
+
+    if num_bits not in _bit_luts:
+        bits = np.unpackbits(np.arange(1 << num_bits, dtype='>u2').view(
+            np.uint8)).reshape(-1, 16)[:, -num_bits:]
+        _bit_luts[num_bits] = np.ascontiguousarray(bits.T, np.float32)
+
+    return _bit_luts[num_bits]
+
+
+def _to_binary_elementwise(x_flat, powers, binary_array):
+    """Greedy binary decomposition of the flat array ``x_flat``.
+
+    Writes the result into ``binary_array`` of shape
+    (``len(powers)``, ``len(x_flat)``). Compiled with numba if available.
+    """
+
+    for l in prange(x_flat.shape[0]):
+        f = x_flat[l]
+        for i in range(powers.shape[0]):
+            if f >= powers[i]:
+                binary_array[i, l] = 1
+                f -= powers[i]
+
+
+if njit is not None:
+    _to_binary_elementwise = njit(cache=True, parallel=True)(
+        _to_binary_elementwise)
 
 
 class SpikeConcatenate(Concatenate):
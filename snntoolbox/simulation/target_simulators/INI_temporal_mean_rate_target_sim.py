@@ -48,6 +48,13 @@ class SNN(AbstractSNN):
         self._input_images = None
         self._binary_activation = None
         self.avg_rate = None
+        self._spiketrain_tensors = None
+        self._mem_tensors = None
+        self._timed_layers = None
+        self._verbose_stride = self.config.getint('output', 'verbose_stride')
+        self._poisson_cache = None
+        self._rng = None
+        self._output_t_b_l = None
 
     @property
     def is_parallelizable(self):
@@ -105,42 +112,61 @@ class SNN(AbstractSNN):
             self._input_images,
             self._spiking_layers[self.parsed_model.layers[-1].name])
         self.snn.compile('sgd', 'categorical_crossentropy', ['accuracy'])
-        self.snn.set_weights(self.parsed_model.get_weights())
-        for layer in self.snn.layers:
-            if hasattr(layer, 'bias'):
-                # Adjust biases to time resolution of simulator.
-                bias = keras.backend.get_value(layer.bias) * self._dt
-                keras.backend.set_value(layer.bias, bias)
-                if self.config.getboolean('cell', 'bias_relaxation'):
-                    keras.backend.set_value(layer.b0,
-                                            keras.backend.get_value(layer.bias))
+        # Adjust biases to time resolution of simulator.
+        biases = self.set_weights_with_scaled_biases(self._dt)
+        if self.config.getboolean('cell', 'bias_relaxation'):
+            keras.backend.batch_set_value([(layer.b0, bias)
+                                           for layer, bias in biases])
+
+        self.cache_layers()
+
+    def cache_layers(self):
+        """Cache the layers of ``self.snn`` that are used at every time step.
+
+        Called after ``self.snn`` has been compiled or loaded.
+        """
+
+        # Layers that have a time attribute.
+        self._timed_layers = [layer for layer in self.snn.layers[1:]
+                              if layer.get_time() is not None]
+
+        # Excludes Input, Flatten, Concatenate, etc:
+        self._spiketrain_tensors = [
+            layer.spiketrain for layer in self.snn.layers
+            if getattr(layer, 'spiketrain', None) is not None]
+        self._mem_tensors = [layer.mem for layer in self.snn.layers
+                             if hasattr(layer, 'mem')]
 
     def simulate(self, **kwargs):
 
         from snntoolbox.utils.utils import echo
         from snntoolbox.simulation.utils import get_layer_synaptic_operations
 
-        input_b_l = kwargs[str('x_b_l')] * self._dt
+        x_b_l = kwargs[str('x_b_l')]
+        dvs_gen = kwargs.get(str('dvs_gen'))
+        truth_b = kwargs[str('truth_b')]
+
+        input_b_l = x_b_l * self._dt
 
-        output_b_l_t = np.zeros((self.batch_size, self.num_classes,
-                                 self._num_timesteps))
+        output_t_b_l = self.get_output_t_b_l()
 
         # Loop through simulation time.
         self.avg_rate = 0
         self._input_spikecount = 0
         actual_num_timesteps = self._num_timesteps
+        early_stopping = self.config.getboolean('simulation', 'early_stopping')
+        verbose = self.config.getint('output', 'verbose')
         for sim_step_int in range(self._num_timesteps):
             sim_step = (sim_step_int + 1) * self._dt
             self.set_time(sim_step)
 
             # Generate new input in case it changes with each simulation step.
             if self._poisson_input:
-                input_b_l = self.get_poisson_frame_batch(kwargs[str('x_b_l')])
+                input_b_l = self.get_poisson_frame_batch(x_b_l)
             elif self._dataset_format == 'aedat':
-                input_b_l = kwargs[str('dvs_gen')].next_eventframe_batch()
+                input_b_l = dvs_gen.next_eventframe_batch()
 
-            if self.config.getboolean('simulation', 'early_stopping') and \
-                    np.count_nonzero(input_b_l) == 0:
+            if early_stopping and np.count_nonzero(input_b_l) == 0:
                 actual_num_timesteps = sim_step
                 print("\nInput empty: Finishing simulation {} steps early."
                       "".format(self._num_timesteps - sim_step_int))
@@ -152,34 +178,27 @@ class SNN(AbstractSNN):
 
             # Add current spikes to previous spikes.
             if remove_classifier:  # Need to flatten output.
-                output_b_l_t[:, :, sim_step_int] = np.argmax(np.reshape(
+                output_t_b_l[sim_step_int] = np.argmax(np.reshape(
                     out_spikes > 0, (out_spikes.shape[0], -1)), 1)
             else:
-                output_b_l_t[:, :, sim_step_int] = out_spikes > 0
+                np.greater(out_spikes, 0, out=output_t_b_l[sim_step_int])
 
             # Record neuron variables.
-            i = j = 0
-            for layer in self.snn.layers:
-                # Excludes Input, Flatten, Concatenate, etc:
-                if hasattr(layer, 'spiketrain') \
-                        and layer.spiketrain is not None:
-                    spiketrains_b_l = keras.backend.get_value(layer.spiketrain)
-                    self.avg_rate += np.count_nonzero(spiketrains_b_l)
-                    if self.spiketrains_n_b_l_t is not None:
-                        self.spiketrains_n_b_l_t[i][0][
-                            Ellipsis, sim_step_int] = spiketrains_b_l
-                    if self.synaptic_operations_b_t is not None:
-                        self.synaptic_operations_b_t[:, sim_step_int] += \
-                            get_layer_synaptic_operations(spiketrains_b_l,
-                                                          self.fanout[i + 1])
-                    if self.neuron_operations_b_t is not None:
-                        self.neuron_operations_b_t[:, sim_step_int] += \
-                            self.num_neurons_with_bias[i + 1]
-                    i += 1
-                if hasattr(layer, 'mem') and self.mem_n_b_l_t is not None:
-                    self.mem_n_b_l_t[j][0][Ellipsis, sim_step_int] = \
-                        keras.backend.get_value(layer.mem)
-                    j += 1
+            spiketrains_n_b_l, mem_n_b_l = self.get_neuron_variables()
+            for i, spiketrains_b_l in enumerate(spiketrains_n_b_l):
+                self.avg_rate += np.count_nonzero(spiketrains_b_l)
+                if self.spiketrains_n_b_l_t is not None:
+                    self.spiketrains_n_b_l_t[i][0][
+                        Ellipsis, sim_step_int] = spiketrains_b_l
+                if self.synaptic_operations_b_t is not None:
+                    self.synaptic_operations_b_t[:, sim_step_int] += \
+                        get_layer_synaptic_operations(spiketrains_b_l,
+                                                      self.fanout[i + 1])
+                if self.neuron_operations_b_t is not None:
+                    self.neuron_operations_b_t[:, sim_step_int] += \
+                        self.num_neurons_with_bias[i + 1]
+            for j, mem_b_l in enumerate(mem_n_b_l):
+                self.mem_n_b_l_t[j][0][Ellipsis, sim_step_int] = mem_b_l
 
             if 'input_b_l_t' in self._log_keys:
                 self.input_b_l_t[Ellipsis, sim_step_int] = input_b_l
@@ -193,21 +212,20 @@ class SNN(AbstractSNN):
                         self.neuron_operations_b_t[:, 0] += self.fanin[1] * \
                             self.num_neurons[1] * np.ones(self.batch_size) * 2
 
-            spike_sums_b_l = np.sum(output_b_l_t, 2)
-            undecided_b = np.sum(spike_sums_b_l, 1) == 0
-            guesses_b = np.argmax(spike_sums_b_l, 1)
-            none_class_b = -1 * np.ones(self.batch_size)
-            clean_guesses_b = np.where(undecided_b, none_class_b, guesses_b)
-            current_acc = np.mean(kwargs[str('truth_b')] == clean_guesses_b)
-            if self.config.getint('output', 'verbose') > 0 \
-                    and sim_step % 1 == 0:
-                echo('{:.2%}_'.format(current_acc))
-            else:
-                sys.stdout.write('\r{:>7.2%}'.format(current_acc))
-                sys.stdout.flush()
+            if sim_step_int % self._verbose_stride == 0:
+                spike_sums_b_l = np.sum(output_t_b_l[:sim_step_int + 1], 0)
+                undecided_b = np.sum(spike_sums_b_l, 1) == 0
+                guesses_b = np.argmax(spike_sums_b_l, 1)
+                clean_guesses_b = np.where(undecided_b, -1, guesses_b)
+                current_acc = np.mean(truth_b == clean_guesses_b)
+                if verbose > 0 and sim_step % 1 == 0:
+                    echo('{:.2%}_'.format(current_acc))
+                else:
+                    sys.stdout.write('\r{:>7.2%}'.format(current_acc))
+                    sys.stdout.flush()
 
         if self._dataset_format == 'aedat':
-            remaining_events = len(kwargs[str('dvs_gen')].event_deques_batch[0])
+            remaining_events = len(dvs_gen.event_deques_batch[0])
         elif self._poisson_input and self._num_poisson_events_per_sample > 0:
             remaining_events = self._num_poisson_events_per_sample - \
                 self._input_spikecount
@@ -225,7 +243,9 @@ class SNN(AbstractSNN):
             print("Average spike rate: {} spikes per simulation time step."
                   "".format(self.avg_rate))
 
-        return np.cumsum(output_b_l_t, 2)
+        np.cumsum(output_t_b_l, 0, out=output_t_b_l)
+
+        return np.transpose(output_t_b_l, (1, 2, 0))
 
     def reset(self, sample_idx):
 
@@ -259,6 +279,8 @@ class SNN(AbstractSNN):
             # since converting even large Keras models from scratch is so fast,
             # there's really no need.
 
+        self.cache_layers()
+
     def get_poisson_frame_batch(self, x_b_l):
         """Get a batch of Poisson input spikes.
 
@@ -278,22 +300,120 @@ class SNN(AbstractSNN):
 
         if self._input_spikecount < self._num_poisson_events_per_sample \
                 or self._num_poisson_events_per_sample < 0:
-            spike_snapshot = np.random.random_sample(x_b_l.shape) \
-                             * self.rescale_fac * np.max(x_b_l)
-            input_b_l = (spike_snapshot <= np.abs(x_b_l)).astype('float32')
+            # The input frame stays the same during the simulation of a
+            # batch, so quantities derived from it are computed only once.
+            if self._poisson_cache is None \
+                    or self._poisson_cache[0] is not x_b_l:
+                max_x = np.max(x_b_l)
+                # For BinaryNets, with input that is not normalized and
+                # not all positive, we stimulate with spikes of the same
+                # size as the maximum activation, and the same sign as
+                # the corresponding activation. Is there a better
+                # solution?
+                self._poisson_cache = (x_b_l, np.abs(x_b_l),
+                                       self.rescale_fac * max_x,
+                                       max_x * np.sign(x_b_l))
+            _, abs_x_b_l, scale, amplitudes_b_l = self._poisson_cache
+            if hasattr(np.random, 'default_rng'):
+                if self._rng is None:
+                    # Seed from the global RNG so that runs stay reproducible
+                    # with ``np.random.seed``.
+                    self._rng = np.random.default_rng(
+                        np.random.randint(2 ** 31))
+                spike_snapshot = self._rng.random(x_b_l.shape, np.float32)
+            else:  # NumPy < 1.17
+                spike_snapshot = np.random.random_sample(
+                    x_b_l.shape).astype('float32')
+            spike_snapshot *= scale
+            spikes_b_l = spike_snapshot <= abs_x_b_l
             self._input_spikecount += \
-                int(np.count_nonzero(input_b_l) / self.batch_size)
-            # For BinaryNets, with input that is not normalized and
-            # not all positive, we stimulate with spikes of the same
-            # size as the maximum activation, and the same sign as
-            # the corresponding activation. Is there a better
-            # solution?
-            input_b_l *= np.max(x_b_l) * np.sign(x_b_l)
+                int(np.count_nonzero(spikes_b_l) / self.batch_size)
+            input_b_l = np.where(spikes_b_l, amplitudes_b_l, 0).astype(
+                'float32')
         else:  # No more input spikes if _input_spikecount exceeded limit.
             input_b_l = np.zeros(x_b_l.shape)
 
         return input_b_l
 
+    def get_neuron_variables(self):
+        """Get the current spiketrains and membrane potentials of the SNN.
+
+        All variables are read from the backend in a single call. Membrane
+        potentials are only fetched if they are being recorded.
+
+        Returns
+        -------
+
+        spiketrains_n_b_l: list[ndarray]
+            Spiketrains of the spiking layers.
+        mem_n_b_l: list[ndarray]
+            Membrane potentials of the spiking layers. Empty if
+            ``mem_n_b_l_t`` is not recorded.
+        """
+
+        tensors = self._spiketrain_tensors
+        if self.mem_n_b_l_t is not None:
+            tensors = tensors + self._mem_tensors
+        values = keras.backend.batch_get_value(tensors)
+        num_spiketrains = len(self._spiketrain_tensors)
+
+        return values[:num_spiketrains], values[num_spiketrains:]
+
+    def set_weights_with_scaled_biases(self, scale):
+        """Load the weights of the parsed model into the SNN.
+
+        The biases are multiplied by ``scale`` on the host before the weights
+        are transferred, so that all parameters are set in a single call.
+
+        Parameters
+        ----------
+
+        scale: float
+            Factor by which to scale the biases.
+
+        Returns
+        -------
+
+        biases: list[tuple]
+            The layers with biases, and their scaled biases.
+        """
+
+        weights = self.parsed_model.get_weights()
+        weight_idxs = {id(w): i for i, w in enumerate(self.snn.weights)}
+        biases = []
+        for layer in self.snn.layers:
+            if getattr(layer, 'bias', None) is not None:
+                bias = weights[weight_idxs[id(layer.bias)]]
+                bias *= scale
+                biases.append((layer, bias))
+        self.snn.set_weights(weights)
+
+        return biases
+
+    def get_output_t_b_l(self):
+        """Get the array in which to record the output spikes of a batch.
+
+        The array is allocated on the first call and reset to zero and reused
+        for all subsequent batches. Time is the leading axis, so that the
+        output spikes of a time step are written to a contiguous block.
+
+        Returns
+        -------
+
+        output_t_b_l: ndarray
+            Array of zeros. Shape: (``num_timesteps``, `batch_size`,
+            `num_classes`).
+        """
+
+        if self._output_t_b_l is None:
+            self._output_t_b_l = np.zeros(
+                (self._num_timesteps, self.batch_size, self.num_classes),
+                'int32')
+        else:
+            self._output_t_b_l.fill(0)
+
+        return self._output_t_b_l
+
     def set_time(self, t):
         """Set the simulation time variable of all layers in the network.
 
@@ -304,9 +424,9 @@ class SNN(AbstractSNN):
             Current simulation time.
         """
 
-        for layer in self.snn.layers[1:]:
-            if layer.get_time() is not None:  # Has time attribute
-                layer.set_time(np.float32(t))
+        t = np.float32(t)
+        for layer in self._timed_layers:
+            layer.set_time(t)
 
     def set_spiketrain_stats_input(self):
         # Added this here because PyCharm complains about not all abstract
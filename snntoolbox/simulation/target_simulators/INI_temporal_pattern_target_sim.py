@@ -13,7 +13,7 @@ from future import standard_library
 
 from snntoolbox.simulation.target_simulators.INI_temporal_mean_rate_target_sim \
     import SNN as SNN_
-from snntoolbox.simulation.utils import get_layer_synaptic_operations
+from snntoolbox.simulation.utils import get_layer_synaptic_operations_b_t
 
 standard_library.install_aliases()
 
@@ -43,26 +43,34 @@ class SNN(SNN_):
 
         self.num_bits = self.config.getint('conversion', 'num_bits')
 
+        # Weights of the individual bits in the fixed-point representation.
+        # Depend only on ``num_bits``, so compute them once here rather than
+        # for every batch.
+        self._bit_weights = np.expand_dims(
+            [2 ** -i for i in range(self.num_bits)], -1).astype('float32')
+        self._bit_indices = np.arange(self.num_bits)
+
+        # Build the bit lookup table used by the binary conversion up front.
+        if self.num_bits <= 16:
+            self.sim.get_bit_lut(self.num_bits)
+
     def compile(self):
         self.snn = keras.models.Model(
             self._input_images,
             self._spiking_layers[self.parsed_model.layers[-1].name])
         self.snn.compile('sgd', 'categorical_crossentropy', ['accuracy'])
-        self.snn.set_weights(self.parsed_model.get_weights())
-        for layer in self.snn.layers:
-            if hasattr(layer, 'bias'):
-                # Adjust biases to time resolution of simulator.
-                bias = keras.backend.get_value(layer.bias) / self._num_timesteps
-                keras.backend.set_value(layer.bias, bias)
+        # Adjust biases to time resolution of simulator.
+        self.set_weights_with_scaled_biases(1 / self._num_timesteps)
+        self.cache_layers()
 
     def simulate(self, **kwargs):
 
         from snntoolbox.utils.utils import echo
 
-        input_b_l = kwargs[str('x_b_l')] * self._dt
+        x_b_l = kwargs[str('x_b_l')]
+        truth_b = kwargs[str('truth_b')]
 
-        output_b_l_t = np.zeros((self.batch_size, self.num_classes,
-                                 self._num_timesteps))
+        input_b_l = x_b_l * self._dt
 
         self._input_spikecount = 0
         self.set_time(self._dt)
@@ -70,10 +78,14 @@ class SNN(SNN_):
         # Main step: Propagate input through network and record output spikes.
         out_spikes = self.snn.predict_on_batch(input_b_l)
 
-        # Add current spikes to previous spikes.
+        # The whole spike pattern is computed in a single step, so the output
+        # spikes are accumulated over time once, and the result is shared by
+        # all samples in the batch.
         x = self.sim.to_binary_numpy(out_spikes, self.num_bits)
-        x *= np.expand_dims([2 ** -i for i in range(self.num_bits)], -1)
-        output_b_l_t[:, :, :] = np.expand_dims(x.transpose(), 0)
+        x *= self._bit_weights
+        output_b_l_t = np.broadcast_to(
+            np.cumsum(x.transpose(), 1),
+            (self.batch_size, self.num_classes, self._num_timesteps))
 
         # Record neuron variables.
         i = 0
@@ -96,10 +108,10 @@ class SNN(SNN_):
                 self.num_neurons[1] * np.ones(self.batch_size) * 2
 
         if self.config.getint('output', 'verbose') > 0:
-            guesses_b = np.argmax(np.sum(output_b_l_t, 2), 1)
-            echo('{:.2%}_'.format(np.mean(kwargs[str('truth_b')] == guesses_b)))
+            guesses_b = np.argmax(output_b_l_t[:, :, -1], 1)
+            echo('{:.2%}_'.format(np.mean(truth_b == guesses_b)))
 
-        return np.cumsum(output_b_l_t, 2)
+        return output_b_l_t
 
     def load(self, path, filename):
         SNN_.load(self, path, filename)
@@ -116,15 +128,14 @@ class SNN(SNN_):
         self.neuron_operations_b_t += self.num_neurons_with_bias[i + 1]
 
     def set_synaptic_operations(self, spiketrains_b_l_t, i):
-        for t in range(self.synaptic_operations_b_t.shape[-1]):
-            self.synaptic_operations_b_t[:, t] += 2 * \
-                get_layer_synaptic_operations(
-                    spiketrains_b_l_t[Ellipsis, t], self.fanout[i + 1])
+        num_timesteps = self.synaptic_operations_b_t.shape[-1]
+        self.synaptic_operations_b_t += 2 * get_layer_synaptic_operations_b_t(
+            spiketrains_b_l_t[Ellipsis, :num_timesteps], self.fanout[i + 1])
 
     def spikerates_to_trains(self, spikerates_b_l):
         x = self.sim.to_binary_numpy(spikerates_b_l, self.num_bits)
         shape = [self.num_bits] + [1] * (x.ndim - 1)
-        x *= np.resize(np.arange(self.num_bits), shape)
+        x *= np.reshape(self._bit_indices, shape)
         perm = (1, 2, 3, 0) if len(x.shape) > 2 else (1, 0)
         spiketrains_b_l_t = np.expand_dims(np.transpose(x, perm), 0)
         return spiketrains_b_l_t
@@ -8,7 +8,6 @@ from __future__ import division, absolute_import
 from __future__ import print_function, unicode_literals
 
 import sys
-import keras
 import numpy as np
 from future import standard_library
 
@@ -37,23 +36,29 @@ class SNN(SNN_):
         from snntoolbox.utils.utils import echo
         from snntoolbox.simulation.utils import get_layer_synaptic_operations
 
-        input_b_l = kwargs[str('x_b_l')] * self._dt
+        x_b_l = kwargs[str('x_b_l')]
+        dvs_gen = kwargs.get(str('dvs_gen'))
+        truth_b = kwargs[str('truth_b')]
 
-        output_b_l_t = np.zeros((self.batch_size, self.num_classes,
-                                 self._num_timesteps))
+        input_b_l = x_b_l * self._dt
+
+        output_t_b_l = self.get_output_t_b_l()
 
         # Loop through simulation time.
         self.avg_rate = 0
         self._input_spikecount = 0
+        verbose = self.config.getint('output', 'verbose')
+        softmax_to_relu = self.config.getboolean('conversion',
+                                                 'softmax_to_relu')
         for sim_step_int in range(self._num_timesteps):
             sim_step = (sim_step_int + 1) * self._dt
             self.set_time(sim_step)
 
             # Generate new input in case it changes with each simulation step.
             if self._poisson_input:
-                input_b_l = self.get_poisson_frame_batch(kwargs[str('x_b_l')])
+                input_b_l = self.get_poisson_frame_batch(x_b_l)
             elif self._dataset_format == 'aedat':
-                input_b_l = kwargs[str('dvs_gen')].next_eventframe_batch()
+                input_b_l = dvs_gen.next_eventframe_batch()
 
             # Main step: Propagate input through network and record output
             # spikes.
@@ -61,34 +66,27 @@ class SNN(SNN_):
 
             # Add current spikes to previous spikes.
             if remove_classifier:  # Need to flatten output.
-                output_b_l_t[:, :, sim_step_int] = np.argmax(np.reshape(
+                output_t_b_l[sim_step_int] = np.argmax(np.reshape(
                     out_spikes > 0, (out_spikes.shape[0], -1)), 1)
             else:
-                output_b_l_t[:, :, sim_step_int] = out_spikes > 0
+                np.greater(out_spikes, 0, out=output_t_b_l[sim_step_int])
 
             # Record neuron variables.
-            i = j = 0
-            for layer in self.snn.layers:
-                # Excludes Input, Flatten, Concatenate, etc:
-                if hasattr(layer, 'spiketrain') \
-                        and layer.spiketrain is not None:
-                    spiketrains_b_l = keras.backend.get_value(layer.spiketrain)
-                    self.avg_rate += np.count_nonzero(spiketrains_b_l)
-                    if self.spiketrains_n_b_l_t is not None:
-                        self.spiketrains_n_b_l_t[i][0][
-                            Ellipsis, sim_step_int] = spiketrains_b_l
-                    if self.synaptic_operations_b_t is not None:
-                        self.synaptic_operations_b_t[:, sim_step_int] += \
-                            get_layer_synaptic_operations(spiketrains_b_l,
-                                                          self.fanout[i + 1])
-                    if self.neuron_operations_b_t is not None:
-                        self.neuron_operations_b_t[:, sim_step_int] += \
-                            self.num_neurons_with_bias[i + 1]
-                    i += 1
-                if hasattr(layer, 'mem') and self.mem_n_b_l_t is not None:
-                    self.mem_n_b_l_t[j][0][Ellipsis, sim_step_int] = \
-                        keras.backend.get_value(layer.mem)
-                    j += 1
+            spiketrains_n_b_l, mem_n_b_l = self.get_neuron_variables()
+            for i, spiketrains_b_l in enumerate(spiketrains_n_b_l):
+                self.avg_rate += np.count_nonzero(spiketrains_b_l)
+                if self.spiketrains_n_b_l_t is not None:
+                    self.spiketrains_n_b_l_t[i][0][
+                        Ellipsis, sim_step_int] = spiketrains_b_l
+                if self.synaptic_operations_b_t is not None:
+                    self.synaptic_operations_b_t[:, sim_step_int] += \
+                        get_layer_synaptic_operations(spiketrains_b_l,
+                                                      self.fanout[i + 1])
+                if self.neuron_operations_b_t is not None:
+                    self.neuron_operations_b_t[:, sim_step_int] += \
+                        self.num_neurons_with_bias[i + 1]
+            for j, mem_b_l in enumerate(mem_n_b_l):
+                self.mem_n_b_l_t[j][0][Ellipsis, sim_step_int] = mem_b_l
 
             if 'input_b_l_t' in self._log_keys:
                 self.input_b_l_t[Ellipsis, sim_step_int] = input_b_l
@@ -102,21 +100,21 @@ class SNN(SNN_):
                         self.neuron_operations_b_t[:, 0] += self.fanin[1] * \
                             self.num_neurons[1] * np.ones(self.batch_size) * 2
 
-            spike_sums_b_l = np.sum(output_b_l_t, 2)
-            undecided_b = np.sum(spike_sums_b_l, 1) == 0
-            guesses_b = np.argmax(spike_sums_b_l, 1)
-            none_class_b = -1 * np.ones(self.batch_size)
-            clean_guesses_b = np.where(undecided_b, none_class_b, guesses_b)
-            current_acc = np.mean(kwargs[str('truth_b')] == clean_guesses_b)
-            if self.config.getint('output', 'verbose') > 0:
-                if sim_step % 1 == 0:
-                    echo('{:.2%}_'.format(current_acc))
-            else:
-                sys.stdout.write('\r{:>7.2%}'.format(current_acc))
-                sys.stdout.flush()
-
-            if self.config.getboolean('conversion', 'softmax_to_relu') and \
-                    all(np.count_nonzero(output_b_l_t, (1, 2)) >= self.top_k):
+            if sim_step_int % self._verbose_stride == 0:
+                spike_sums_b_l = np.sum(output_t_b_l[:sim_step_int + 1], 0)
+                undecided_b = np.sum(spike_sums_b_l, 1) == 0
+                guesses_b = np.argmax(spike_sums_b_l, 1)
+                clean_guesses_b = np.where(undecided_b, -1, guesses_b)
+                current_acc = np.mean(truth_b == clean_guesses_b)
+                if verbose > 0:
+                    if sim_step % 1 == 0:
+                        echo('{:.2%}_'.format(current_acc))
+                else:
+                    sys.stdout.write('\r{:>7.2%}'.format(current_acc))
+                    sys.stdout.flush()
+
+            if softmax_to_relu and \
+                    all(np.count_nonzero(output_t_b_l, (0, 2)) >= self.top_k):
                 print("Finished early.")
                 break
 
@@ -127,7 +125,9 @@ class SNN(SNN_):
             print("Average spike rate: {} spikes per simulation time step."
                   "".format(self.avg_rate))
 
-        return np.cumsum(output_b_l_t, 2)
+        np.cumsum(output_t_b_l, 0, out=output_t_b_l)
+
+        return np.transpose(output_t_b_l, (1, 2, 0))
 
     def load(self, path, filename):
         SNN_.load(self, path, filename)
@@ -941,11 +941,7 @@ class AbstractSNN:
         shape = (self.batch_size, self.num_classes, self._num_timesteps)
         output_b_l_t = np.zeros(shape, 'int32')
         spiketrains_b_l_t = self.get_spiketrains_output()
-        for b in range(shape[0]):
-            for l in range(shape[1]):
-                for t in range(shape[2]):
-                    output_b_l_t[b, l, t] = np.count_nonzero(
-                        spiketrains_b_l_t[b, l, :t+1])
+        np.cumsum(np.not_equal(spiketrains_b_l_t, 0), 2, out=output_b_l_t)
         return output_b_l_t
 
     def reset_container_counters(self):
@@ -1412,11 +1408,47 @@ def get_layer_synaptic_operations(spiketrains_b_l, fanout):
         The total number of operations in the layer for a batch of samples.
     """
 
+    spikes_b_l = np.reshape(np.not_equal(spiketrains_b_l, 0),
+                            (len(spiketrains_b_l), -1))
     if np.isscalar(fanout):
-        return np.array([np.count_nonzero(s) for s in spiketrains_b_l]) * \
-            fanout
+        return np.count_nonzero(spikes_b_l, 1) * fanout
     elif hasattr(fanout, 'shape'):  # For conv layers with stride > 1
-        return np.array([np.sum(fanout[s != 0]) for s in spiketrains_b_l])
+        return np.dot(spikes_b_l, np.ravel(fanout))
+    else:
+        raise TypeError("The 'fanout' parameter should either be integer or "
+                        "ndarray.")
+
+
+def get_layer_synaptic_operations_b_t(spiketrains_b_l_t, fanout):
+    """
+    Return number of synaptic operations in the layer for a batch of samples,
+    separately for each time step.
+
+    Parameters
+    ----------
+
+    spiketrains_b_l_t: ndarray
+        Batch of spiketrains of a layer.
+        Shape: (batch_size, layer_shape, num_timesteps)
+    fanout: Union[int, ndarray]
+        Number of outgoing connections per neuron. Can be a single integer, or
+        an array of the same shape as the layer, if the fanout varies from
+        neuron to neuron (as is the case in convolution layers with stride > 1).
+
+    Returns
+    -------
+
+    layer_ops_b_t: ndarray
+        The number of operations in the layer for a batch of samples at each
+        time step. Shape: (batch_size, num_timesteps)
+    """
+
+    shape = (len(spiketrains_b_l_t), -1, spiketrains_b_l_t.shape[-1])
+    spikes_b_l_t = np.reshape(np.not_equal(spiketrains_b_l_t, 0), shape)
+    if np.isscalar(fanout):
+        return np.count_nonzero(spikes_b_l_t, 1) * fanout
+    elif hasattr(fanout, 'shape'):  # For conv layers with stride > 1
+        return np.einsum('blt,l->bt', spikes_b_l_t, np.ravel(fanout))
     else:
         raise TypeError("The 'fanout' parameter should either be integer or "
                         "ndarray.")
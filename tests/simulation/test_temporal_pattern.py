@@ -0,0 +1,45 @@
+# coding=utf-8
+
+import numpy as np
+import pytest
+
+temporal_pattern = pytest.importorskip(
+    'snntoolbox.simulation.backends.inisim.temporal_pattern')
+
+
+def to_binary_greedy(x, num_bits):
+    """Reference implementation: Greedy subtraction of powers of two."""
+
+    binary_array = np.zeros([num_bits] + list(x.shape[1:]))
+    powers = [2**-i for i in range(num_bits)]
+    x_flat = np.ravel(x[0])
+    binary_flat = np.reshape(binary_array, (num_bits, -1))
+    for l in range(len(x_flat)):
+        f = x_flat[l]
+        for i in range(num_bits):
+            if f >= powers[i]:
+                binary_flat[i, l] = 1
+                f -= powers[i]
+    return binary_array
+
+
+class TestToBinaryNumpy:
+    """Test conversion of activations into binary spike patterns."""
+
+    @pytest.mark.parametrize('num_bits', [8, 16, 32, 64, 65, 80])
+    def test_to_binary_numpy(self, num_bits):
+        x = np.array([[-1.5, -2 ** -40, 0, 2 ** -40, 0.3, 1, 1.5,
+                       1.9999, 2, 3.5, 100, np.inf, -np.inf, np.nan]],
+                     'float32')
+        x = np.concatenate([x, np.random.random_sample((1, 20)) * 2], 1)
+        target = to_binary_greedy(x, num_bits)
+        binary_array = temporal_pattern.to_binary_numpy(x, num_bits)
+        assert binary_array.shape == target.shape
+        assert np.array_equal(binary_array, target)
+
+    @pytest.mark.parametrize('num_bits', [8, 32])
+    def test_to_binary_numpy_4d(self, num_bits):
+        x = np.random.random_sample((1, 2, 3, 4)) * 5 - 1
+        target = to_binary_greedy(x, num_bits)
+        binary_array = temporal_pattern.to_binary_numpy(x, num_bits)
+        assert np.array_equal(binary_array, target)
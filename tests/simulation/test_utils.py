@@ -0,0 +1,49 @@
+# coding=utf-8
+
+import numpy as np
+import pytest
+
+utils = pytest.importorskip('snntoolbox.simulation.utils')
+
+
+def get_layer_synaptic_operations_loop(spiketrains_b_l, fanout):
+    """Reference implementation: Loop over samples."""
+
+    if np.isscalar(fanout):
+        return np.array([np.count_nonzero(s) for s in spiketrains_b_l]) * \
+            fanout
+    return np.array([np.sum(fanout[s != 0]) for s in spiketrains_b_l])
+
+
+def get_spiketrains_and_fanouts(layer_shape):
+    spiketrains_b_l_t = np.random.random_sample((3,) + layer_shape + (5,))
+    spiketrains_b_l_t[spiketrains_b_l_t < 0.6] = 0
+    fanout_int = 7
+    fanout_array = np.random.randint(1, 10, layer_shape)
+    return spiketrains_b_l_t, [fanout_int, fanout_array]
+
+
+@pytest.mark.parametrize('layer_shape', [(4,), (2, 3, 4)])
+class TestGetLayerSynapticOperations:
+    """Test counting synaptic operations of a layer."""
+
+    def test_get_layer_synaptic_operations(self, layer_shape):
+        spiketrains_b_l_t, fanouts = get_spiketrains_and_fanouts(layer_shape)
+        for fanout in fanouts:
+            for t in range(spiketrains_b_l_t.shape[-1]):
+                spiketrains_b_l = spiketrains_b_l_t[Ellipsis, t]
+                target = get_layer_synaptic_operations_loop(spiketrains_b_l,
+                                                            fanout)
+                layer_ops_b = utils.get_layer_synaptic_operations(
+                    spiketrains_b_l, fanout)
+                assert np.array_equal(layer_ops_b, target)
+
+    def test_get_layer_synaptic_operations_b_t(self, layer_shape):
+        spiketrains_b_l_t, fanouts = get_spiketrains_and_fanouts(layer_shape)
+        for fanout in fanouts:
+            target = np.stack([get_layer_synaptic_operations_loop(
+                spiketrains_b_l_t[Ellipsis, t], fanout)
+                for t in range(spiketrains_b_l_t.shape[-1])], -1)
+            layer_ops_b_t = utils.get_layer_synaptic_operations_b_t(
+                spiketrains_b_l_t, fanout)
+            assert np.array_equal(layer_ops_b_t, target)